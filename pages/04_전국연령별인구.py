@@ -0,0 +1,242 @@
+import re
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# 페이지 기본 설정
+st.set_page_config(
+    page_title="전국 연령별 인구 분포",
+    page_icon="👪",
+    layout="wide"
+)
+
+# --- 상수 및 설정 ---
+DATA_FILE = 'age202510.csv'
+LEVELS = ["시도", "시군구", "읍면동"]
+AGE_BIN_WIDTHS = [5, 10]        # 미리 계산해 둘 연령 구간 (세밀한 것 -> 거친 것 순서)
+MAX_HEATMAP_CELLS = 600         # 히트맵 한 장에 그릴 최대 칸 수 (지역 수 x 연령 구간 수)
+MAX_TREEMAP_NODES = 300         # 트리맵 한 장에 그릴 최대 상자 수
+
+
+def age_bin_labels(width):
+    """연령 구간 이름 목록 (예: 0~9세, ..., 90~99세, 100세 이상)"""
+    labels = [f"{start}~{start + width - 1}세" for start in range(0, 100, width)]
+    return labels + ["100세 이상"]
+
+
+def bin_age_columns(counts, width):
+    """0세 ~ 100세 이상 (101개) 컬럼을 width세 단위 구간으로 합치기"""
+    binned = pd.DataFrame(index=counts.index)
+    for i, label in enumerate(age_bin_labels(width)):
+        binned[label] = counts.iloc[:, i * width:(i + 1) * width].sum(axis=1)
+    return binned
+
+
+@st.cache_data
+def load_lod_tables():
+    """
+    읍면동 원자료에서 시도 / 시군구 / 읍면동 집계표를 5세, 10세 구간별로 미리 계산
+    반환값: {(단계, 구간폭): DataFrame}
+    """
+    raw = pd.read_csv(DATA_FILE, encoding='utf-8-sig', dtype=str)
+
+    # '서울특별시 종로구 사직동(1111053000)' -> 이름과 10자리 행정코드 분리
+    parsed = raw['행정구역'].str.extract(r'^(?P<name>.*?)\s*\((?P<code>\d{10})\)$')
+    names = parsed['name'].str.split().str.join(' ')
+    codes = parsed['code']
+
+    # 숫자 컬럼: '9313532 ' 처럼 공백/쉼표가 섞여 있으므로 정리 후 변환
+    age_cols = [c for c in raw.columns if re.search(r'_계_\d+세', c)]
+    counts = raw[age_cols].apply(
+        lambda s: pd.to_numeric(s.str.replace(',', '').str.strip())
+    )
+    counts.columns = [f"{i}세" for i in range(len(age_cols))]
+
+    # 코드 이름 사전 (시도: 앞 2자리, 시군구: 앞 5자리)
+    name_by_code = dict(zip(codes, names))
+    sido_names = {c[:2]: n for c, n in name_by_code.items() if c[2:] == '00000000'}
+
+    def sigungu_name(prefix):
+        # '경기도 수원시 장안구' -> '수원시 장안구', 세종처럼 시군구가 없으면 시도 이름 사용
+        full = name_by_code.get(prefix + '00000', '')
+        short = full.split(' ', 1)[1] if ' ' in full else ''
+        return short or sido_names[prefix[:2]]
+
+    # 가장 세밀한 단계(읍면동)만 남기고, 인구가 0인 출장소 행은 제외
+    is_leaf = codes.str[5:] != '00000'
+    leaf = counts[is_leaf].copy()
+    leaf = leaf[leaf.sum(axis=1) > 0]
+    leaf_codes = codes[leaf.index]
+
+    keys = pd.DataFrame({
+        "읍면동코드": leaf_codes,
+        "시군구코드": leaf_codes.str[:5],
+        "시도코드": leaf_codes.str[:2],
+        "읍면동": names[leaf.index].str.split().str[-1],
+    })
+    keys["시도"] = keys["시도코드"].map(sido_names)
+    keys["시군구"] = keys["시군구코드"].map(sigungu_name)
+
+    # 시군구는 '수원시'와 '수원시 장안구'가 함께 실려 있어 그대로 더하면 중복되므로,
+    # 읍면동 행을 코드 앞자리로 묶어 다시 집계한다.
+    key_cols = {
+        "시도": ["시도코드", "시도"],
+        "시군구": ["시도코드", "시도", "시군구코드", "시군구"],
+        "읍면동": ["시도코드", "시도", "시군구코드", "시군구", "읍면동코드", "읍면동"],
+    }
+
+    tables = {}
+    for width in AGE_BIN_WIDTHS:
+        binned = pd.concat([keys, bin_age_columns(leaf, width)], axis=1)
+        for level in LEVELS:
+            table = binned.groupby(key_cols[level], sort=False, as_index=False).sum(numeric_only=True)
+            table.insert(len(key_cols[level]), "총인구", table[age_bin_labels(width)].sum(axis=1))
+            tables[(level, width)] = table
+    return tables
+
+
+@st.cache_data
+def fetch_rows(level, width, sido_code=None, sigungu_code=None):
+    """선택한 상위 지역에 속한 행만 잘라서 반환 (드릴다운할 때만 세밀한 행을 가져옴)"""
+    table = load_lod_tables()[(level, width)]
+    if sido_code is not None:
+        table = table[table["시도코드"] == sido_code]
+    if sigungu_code is not None:
+        table = table[table["시군구코드"] == sigungu_code]
+    return table.reset_index(drop=True)
+
+
+def choose_age_width(n_rows):
+    """히트맵 칸 수가 예산 안에 들어가는 가장 세밀한 연령 구간 선택"""
+    for width in AGE_BIN_WIDTHS:
+        if n_rows * len(age_bin_labels(width)) <= MAX_HEATMAP_CELLS:
+            return width
+    return AGE_BIN_WIDTHS[-1]
+
+
+def choose_treemap_depth(child_level, sido_code=None, sigungu_code=None):
+    """트리맵 상자 수가 예산 안에 들어가는 가장 깊은 단계 선택 (최소 한 단계는 표시)"""
+    start = LEVELS.index(child_level)
+    depth = start
+    n_nodes = 0
+    for i in range(start, len(LEVELS)):
+        n_nodes += len(fetch_rows(LEVELS[i], AGE_BIN_WIDTHS[-1], sido_code, sigungu_code))
+        if n_nodes > MAX_TREEMAP_NODES and i > start:
+            break
+        depth = i
+    return LEVELS[depth]
+
+
+def draw_heatmap(rows, level, width):
+    """지역(행) x 연령 구간(열) 인구 비율 히트맵"""
+    labels = age_bin_labels(width)
+    counts = rows[labels]
+    shares = counts.div(rows["총인구"], axis=0) * 100
+
+    fig = go.Figure(go.Heatmap(
+        z=shares.values,
+        x=labels,
+        y=rows[level],
+        customdata=counts.values,
+        colorscale='YlOrRd',
+        colorbar=dict(title="비율(%)"),
+        hovertemplate="%{y} · %{x}<br>비율: %{z:.1f}%<br>인구: %{customdata:,}명<extra></extra>"
+    ))
+    fig.update_layout(
+        xaxis_title="연령 구간",
+        yaxis=dict(title=level, autorange="reversed"),
+        height=max(400, 22 * len(rows) + 150),
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig
+
+
+def draw_treemap(rows, path, scope_label, color_bin):
+    """인구 규모(면적)와 선택한 연령대 비율(색)을 보여주는 트리맵"""
+    data = rows[path + ["총인구"]].copy()
+    data["비율"] = rows[color_bin] / rows["총인구"] * 100
+
+    fig = px.treemap(
+        data,
+        path=[px.Constant(scope_label)] + path,
+        values="총인구",
+        color="비율",
+        color_continuous_scale='YlOrRd',
+        labels={"총인구": "인구", "비율": f"{color_bin} 비율(%)"}
+    )
+    fig.update_traces(hovertemplate="%{label}<br>인구: %{value:,}명<br>비율: %{color:.1f}%<extra></extra>")
+    fig.update_layout(height=600, margin=dict(l=10, r=10, t=30, b=10))
+    return fig
+
+
+# --- 메인 UI 구성 ---
+
+st.title("👪 전국 행정구역별 연령 인구 분포")
+st.markdown("""
+시도 → 시군구 → 읍면동 순서로 **드릴다운**하며 연령별 인구 분포를 살펴보세요.
+화면에는 현재 보기에 필요한 만큼의 집계 자료만 그려지므로, 전국을 보아도 차트가 가볍게 표시됩니다.
+""")
+
+try:
+    sido_table = fetch_rows("시도", AGE_BIN_WIDTHS[-1])
+except FileNotFoundError:
+    st.error(f"데이터 파일({DATA_FILE})을 찾을 수 없습니다. 앱과 같은 폴더에 파일을 위치시켜 주세요.")
+    st.stop()
+
+# 드릴다운 선택 (시도 -> 시군구)
+col_sido, col_sigungu, col_chart = st.columns(3)
+with col_sido:
+    sido_options = ["전국"] + sido_table["시도"].tolist()
+    selected_sido = st.selectbox("📍 시도", sido_options)
+
+sido_code = None
+sigungu_code = None
+scope_label = selected_sido
+child_level = "시도"
+
+if selected_sido != "전국":
+    sido_code = sido_table.loc[sido_table["시도"] == selected_sido, "시도코드"].iloc[0]
+    child_level = "시군구"
+    sigungu_table = fetch_rows("시군구", AGE_BIN_WIDTHS[-1], sido_code)
+    with col_sigungu:
+        sigungu_options = ["전체"] + sigungu_table["시군구"].tolist()
+        selected_sigungu = st.selectbox("🏘️ 시군구", sigungu_options)
+    if selected_sigungu != "전체":
+        sigungu_code = sigungu_table.loc[sigungu_table["시군구"] == selected_sigungu, "시군구코드"].iloc[0]
+        child_level = "읍면동"
+        scope_label = f"{selected_sido} {selected_sigungu}"
+
+with col_chart:
+    chart_type = st.radio("📊 차트 종류", ["히트맵", "트리맵"], horizontal=True)
+
+st.divider()
+
+if chart_type == "히트맵":
+    n_rows = len(fetch_rows(child_level, AGE_BIN_WIDTHS[-1], sido_code, sigungu_code))
+    width_options = ["자동"] + [f"{w}세" for w in AGE_BIN_WIDTHS]
+    width_choice = st.radio("연령 구간", width_options, horizontal=True)
+    if width_choice == "자동":
+        width = choose_age_width(n_rows)
+    else:
+        width = int(width_choice.rstrip("세"))
+
+    rows = fetch_rows(child_level, width, sido_code, sigungu_code)
+    st.subheader(f"🌡️ {scope_label}: {child_level}별 연령 구간 인구 비율")
+    st.plotly_chart(draw_heatmap(rows, child_level, width), use_container_width=True)
+    st.caption(f"표시 단계: {child_level} {len(rows)}곳 × {width}세 구간 ({len(rows) * len(age_bin_labels(width)):,}칸)")
+else:
+    color_bin = st.selectbox("색상 기준 연령대", age_bin_labels(10), index=6)
+    depth_level = choose_treemap_depth(child_level, sido_code, sigungu_code)
+    path = LEVELS[LEVELS.index(child_level):LEVELS.index(depth_level) + 1]
+
+    rows = fetch_rows(depth_level, 10, sido_code, sigungu_code)
+    st.subheader(f"🗺️ {scope_label}: 인구 규모와 {color_bin} 비율")
+    st.plotly_chart(draw_treemap(rows, path, scope_label, color_bin), use_container_width=True)
+    caption = f"표시 단계: {' → '.join(path)} ({depth_level} {len(rows):,}곳)"
+    if depth_level != LEVELS[-1]:
+        caption += " · 더 세밀한 지역은 위에서 시도/시군구를 선택하면 나타납니다."
+    st.caption(caption)
+
+st.caption(f"Data Source: {DATA_FILE} (행정안전부 주민등록 연령별 인구, 2025년 10월)")